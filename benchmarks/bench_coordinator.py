@@ -0,0 +1,56 @@
+"""
+Coordinator Benchmarks
+
+Measures AlfredPrime routing latency and fan-out latency across growing
+numbers of fake specialized agents.
+"""
+
+from typing import Dict, List, Any
+
+from harness import result, time_calls
+from agents.alfred_prime.coordinator import AlfredPrime
+from agents.specialized.agent_base import SpecializedAgent
+
+AGENT_COUNTS = (1, 8, 32, 128)
+QUICK_AGENT_COUNTS = (1, 8, 32)
+ITERATIONS = 1000
+DOMAINS = ("research", "writing", "coding", "math", "scheduling", "travel", "finance", "health")
+
+class FakeAgent(SpecializedAgent):
+    """Specialized agent that answers immediately, so timings are coordinator overhead."""
+    
+    def process(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        return {"response": f"{self.agent_id} done"}
+
+def build_coordinator(agents: int) -> AlfredPrime:
+    """Create a coordinator with ``agents`` fake agents spread across DOMAINS."""
+    coordinator = AlfredPrime()
+    for i in range(agents):
+        domain = DOMAINS[i % len(DOMAINS)]
+        agent_id = f"{domain}_{i}"
+        agent = FakeAgent(agent_id, capabilities=[domain, f"{domain} analysis"], keywords=[agent_id])
+        coordinator.register_agent(agent_id, agent)
+    return coordinator
+
+def run(quick: bool = False) -> List[Dict[str, Any]]:
+    """
+    Run the coordinator benchmarks.
+    
+    Args:
+        quick: Use fewer agent counts
+        
+    Returns:
+        Result records
+    """
+    results = []
+    for agents in QUICK_AGENT_COUNTS if quick else AGENT_COUNTS:
+        coordinator = build_coordinator(agents)
+        agent_ids = list(coordinator.specialized_agents)
+        params = {"agents": agents}
+        
+        routed_task = {"description": f"please handle this {agent_ids[-1]} request"}
+        results.append(result("coordinator.route", params, time_calls(lambda: coordinator.route_task(routed_task), ITERATIONS)))
+        
+        fan_out_task = {"description": "broadcast", "agent_ids": agent_ids}
+        results.append(result("coordinator.fan_out", params, time_calls(lambda: coordinator.orchestrate(fan_out_task), ITERATIONS)))
+    return results
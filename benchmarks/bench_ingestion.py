@@ -0,0 +1,117 @@
+"""
+Ingestion Benchmarks
+
+Measures chunk, embed and store throughput over the bundled raw-data
+transcripts. Embeddings come from a deterministic feature-hashing embedder so
+the benchmark stays offline and isolates the pipeline's own overhead.
+"""
+
+from typing import Dict, List, Any
+import glob
+import os
+import time
+import zlib
+
+import numpy as np
+
+from harness import SRC_DIR, best_of, result
+from knowledge_graph.vector_db.embeddings_store import VectorStore
+
+RAW_DATA_DIR = os.path.join(SRC_DIR, "knowledge_graph", "raw-data")
+CHUNK_SIZES = (100, 200, 400)
+QUICK_CHUNK_SIZES = (200,)
+DIMENSION = 384
+
+def chunk_words(text: str, chunk_size: int, overlap: int) -> List[str]:
+    """
+    Split text into overlapping word windows.
+    
+    Args:
+        text: Text to split
+        chunk_size: Words per chunk
+        overlap: Words shared between consecutive chunks
+        
+    Returns:
+        List of chunk texts
+    """
+    words = text.split()
+    step = max(1, chunk_size - overlap)
+    return [" ".join(words[i:i + chunk_size]) for i in range(0, max(1, len(words) - overlap), step)]
+
+def hash_embedding(text: str, dimension: int = DIMENSION) -> np.ndarray:
+    """
+    Embed text by hashing its lowercase tokens into a fixed-size vector.
+    
+    Args:
+        text: Text to embed
+        dimension: Vector dimension
+        
+    Returns:
+        L2-normalized embedding
+    """
+    vector = np.zeros(dimension, dtype=np.float32)
+    for token in text.lower().split():
+        vector[zlib.crc32(token.encode("utf-8")) % dimension] += 1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+def load_transcripts() -> Dict[str, str]:
+    """
+    Read the bundled raw-data transcripts.
+    
+    Returns:
+        Mapping of file name to file text
+    """
+    transcripts = {}
+    for path in sorted(glob.glob(os.path.join(RAW_DATA_DIR, "*.txt"))):
+        with open(path, encoding="utf-8") as f:
+            transcripts[os.path.basename(path)] = f.read()
+    return transcripts
+
+def bench_case(transcripts: Dict[str, str], chunk_size: int) -> Dict[str, Any]:
+    """
+    Benchmark ingesting all transcripts with one chunk size.
+    
+    Args:
+        transcripts: Mapping of file name to file text
+        chunk_size: Words per chunk
+        
+    Returns:
+        Result record
+    """
+    total_bytes = sum(len(text.encode("utf-8")) for text in transcripts.values())
+    chunks = 0
+    
+    def ingest():
+        nonlocal chunks
+        store = VectorStore({"dimension": DIMENSION})
+        chunks = 0
+        start = time.perf_counter()
+        for name, text in transcripts.items():
+            for i, chunk in enumerate(chunk_words(text, chunk_size, chunk_size // 4)):
+                store.add_embedding(f"{name}:{i}", hash_embedding(chunk), {"source": name, "chunk": i})
+                chunks += 1
+        return time.perf_counter() - start
+        
+    seconds = best_of(ingest)
+    
+    return result(
+        "ingestion.transcripts",
+        {"chunk_size": chunk_size, "dimension": DIMENSION, "chunks": chunks},
+        {"chunks_per_sec": chunks / seconds, "mb_per_sec": total_bytes / 1e6 / seconds}
+    )
+
+def run(quick: bool = False) -> List[Dict[str, Any]]:
+    """
+    Run the ingestion benchmarks.
+    
+    Args:
+        quick: Use a single chunk size
+        
+    Returns:
+        Result records
+    """
+    transcripts = load_transcripts()
+    if not transcripts:
+        return []
+    return [bench_case(transcripts, chunk_size) for chunk_size in (QUICK_CHUNK_SIZES if quick else CHUNK_SIZES)]
@@ -0,0 +1,48 @@
+"""
+ToolRegistry Benchmarks
+
+Measures the overhead Tool.execute and registry lookup add on top of calling
+the tool function directly.
+"""
+
+from typing import Dict, List, Any
+
+from harness import result, time_calls
+from tools.api_integrations.tool_registry import Tool, ToolRegistry
+
+ITERATIONS = 4000
+REGISTRY_SIZES = (10, 1000)
+
+def _add(a: int, b: int) -> int:
+    """Trivial tool body so timings reflect framework overhead."""
+    return a + b
+
+def run(quick: bool = False) -> List[Dict[str, Any]]:
+    """
+    Run the ToolRegistry benchmarks.
+    
+    Args:
+        quick: Unused; the tools suite is already small
+        
+    Returns:
+        Result records
+    """
+    results = []
+    
+    direct = time_calls(lambda: _add(a=1, b=2), ITERATIONS)
+    results.append(result("tools.direct_call", {}, direct))
+    
+    tool = Tool("add", "Add two integers", _add)
+    execute = time_calls(lambda: tool.execute(a=1, b=2), ITERATIONS)
+    execute["overhead_us"] = execute["mean_us"] - direct["mean_us"]
+    results.append(result("tools.execute", {}, execute))
+    
+    for size in REGISTRY_SIZES:
+        registry = ToolRegistry()
+        for i in range(size):
+            registry.register_tool(Tool(f"add_{i}", "Add two integers", _add))
+        lookup = time_calls(lambda: registry.get_tool(f"add_{size // 2}").execute(a=1, b=2), ITERATIONS)
+        lookup["overhead_us"] = lookup["mean_us"] - direct["mean_us"]
+        results.append(result("tools.registry_execute", {"registry_size": size}, lookup))
+        
+    return results
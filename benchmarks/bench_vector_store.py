@@ -0,0 +1,99 @@
+"""
+VectorStore Benchmarks
+
+Measures add_embedding and search throughput, plus search recall@k against
+an exact brute-force cosine ranking, across corpus sizes and dimensions.
+VectorStore.search still returns a hard-coded placeholder hit, so recall is
+left out of the results while search returns IDs that are not in the store;
+it is reported automatically once search is implemented.
+"""
+
+from typing import Dict, List, Any
+import time
+
+import numpy as np
+
+from harness import best_of, result, time_calls
+from knowledge_graph.vector_db.embeddings_store import VectorStore
+
+SIZES = (1000, 10000)
+DIMENSIONS = (128, 384, 1536)
+QUICK_SIZES = (1000,)
+QUICK_DIMENSIONS = (128, 384)
+TOP_K = 10
+NUM_QUERIES = 50
+SEARCH_ITERATIONS = 200
+
+def _exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> List[List[int]]:
+    """Rank the corpus by cosine similarity to each query."""
+    corpus_norm = corpus / np.linalg.norm(corpus, axis=1, keepdims=True)
+    query_norm = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    scores = query_norm @ corpus_norm.T
+    return [list(np.argsort(-row)[:k]) for row in scores]
+
+def bench_case(size: int, dimension: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Benchmark one corpus size and dimension.
+    
+    Args:
+        size: Number of vectors in the corpus
+        dimension: Vector dimension
+        seed: Random seed for the synthetic corpus
+        
+    Returns:
+        Result records for add and search
+    """
+    rng = np.random.default_rng(seed)
+    corpus = rng.standard_normal((size, dimension)).astype(np.float32)
+    # Queries are perturbed corpus vectors so the exact neighbours are meaningful
+    anchors = rng.choice(size, NUM_QUERIES, replace=False)
+    queries = corpus[anchors] + 0.1 * rng.standard_normal((NUM_QUERIES, dimension)).astype(np.float32)
+    params = {"size": size, "dimension": dimension}
+    store = None
+    
+    def add_all():
+        nonlocal store
+        store = VectorStore({"dimension": dimension})
+        start = time.perf_counter()
+        for i, vector in enumerate(corpus):
+            store.add_embedding(f"doc_{i}", vector, {"index": i})
+        return time.perf_counter() - start
+        
+    add_seconds = best_of(add_all)
+    
+    query_iter = iter(range(10 ** 9))
+    search_metrics = time_calls(
+        lambda: store.search(queries[next(query_iter) % NUM_QUERIES], top_k=TOP_K),
+        iterations=SEARCH_ITERATIONS
+    )
+    
+    truth = _exact_top_k(corpus, queries, TOP_K)
+    hits = 0
+    searches_real_ids = True
+    for query, expected in zip(queries, truth):
+        returned = {match["text_id"] for match in store.search(query, top_k=TOP_K)}
+        searches_real_ids = searches_real_ids and returned <= store.vectors.keys()
+        hits += len(returned & {f"doc_{i}" for i in expected})
+    if searches_real_ids:
+        search_metrics["recall"] = hits / (TOP_K * NUM_QUERIES)
+        
+    return [
+        result("vector_store.add", params, {"ops_per_sec": size / add_seconds, "mean_us": add_seconds / size * 1e6}),
+        result("vector_store.search", params, search_metrics),
+    ]
+
+def run(quick: bool = False) -> List[Dict[str, Any]]:
+    """
+    Run the VectorStore benchmarks.
+    
+    Args:
+        quick: Use the reduced size/dimension grid
+        
+    Returns:
+        Result records
+    """
+    results = []
+    for size in QUICK_SIZES if quick else SIZES:
+        for dimension in QUICK_DIMENSIONS if quick else DIMENSIONS:
+            results.extend(bench_case(size, dimension))
+    return results
@@ -0,0 +1,58 @@
+"""
+WorkflowEngine Benchmarks
+
+Measures register/execute/status overhead for wide (fan-out) and deep
+(chain) workflow DAGs. WorkflowEngine does not run individual steps yet, so
+these numbers cover dispatch; they start covering step scheduling as soon as
+the engine does, without changes here.
+"""
+
+from typing import Dict, List, Any
+
+from harness import result, time_calls
+from core.orchestration.workflow_engine import WorkflowEngine
+
+STEP_COUNTS = (10, 100, 1000)
+QUICK_STEP_COUNTS = (10, 100)
+ITERATIONS = 200
+
+def wide_dag(steps: int) -> Dict[str, Any]:
+    """Build a workflow with one root step fanning out to ``steps`` children."""
+    definition = [{"id": "root", "agent": "agent_0", "depends_on": []}]
+    definition += [{"id": f"step_{i}", "agent": f"agent_{i % 8}", "depends_on": ["root"]} for i in range(steps)]
+    return {"steps": definition}
+
+def deep_dag(steps: int) -> Dict[str, Any]:
+    """Build a workflow whose ``steps`` steps form a single dependency chain."""
+    definition = [{"id": "step_0", "agent": "agent_0", "depends_on": []}]
+    definition += [
+        {"id": f"step_{i}", "agent": f"agent_{i % 8}", "depends_on": [f"step_{i - 1}"]}
+        for i in range(1, steps)
+    ]
+    return {"steps": definition}
+
+def run(quick: bool = False) -> List[Dict[str, Any]]:
+    """
+    Run the WorkflowEngine benchmarks.
+    
+    Args:
+        quick: Use fewer step counts
+        
+    Returns:
+        Result records
+    """
+    results = []
+    for shape, build in (("wide", wide_dag), ("deep", deep_dag)):
+        for steps in QUICK_STEP_COUNTS if quick else STEP_COUNTS:
+            engine = WorkflowEngine()
+            definition = build(steps)
+            counter = iter(range(10 ** 9))
+            
+            def cycle():
+                workflow_id = f"{shape}_{next(counter)}"
+                engine.register_workflow(workflow_id, definition)
+                engine.execute_workflow(workflow_id)
+                engine.get_workflow_status(workflow_id)
+                
+            results.append(result("workflow.execute", {"shape": shape, "steps": steps}, time_calls(cycle, ITERATIONS)))
+    return results
@@ -0,0 +1,259 @@
+"""
+Benchmark Harness
+
+Timing helpers, result records and baseline comparison shared by the
+benchmark modules. Everything here runs offline with synthetic data.
+"""
+
+from typing import Dict, List, Any, Callable, Optional
+import gc
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# Metrics whose value should go up; everything else is a latency/cost
+HIGHER_IS_BETTER_SUFFIXES = ("_per_sec", "recall")
+
+# Metrics that are repeatable enough to fail a comparison: best-of-rounds
+# throughput, median latency and recall. Means, tail latencies and derived
+# overheads swing by more than the threshold between identical runs, so
+# they are reported but never counted as regressions.
+GATED_METRICS = ("ops_per_sec", "chunks_per_sec", "mb_per_sec", "p50_us", "recall")
+
+# Relative change that counts as a regression. Identical runs on a shared
+# single-vCPU VM moved gated metrics by up to ~25%, mostly because the whole
+# machine ran up to 15% faster or slower from one run to the next; use a
+# lower threshold on dedicated hardware.
+DEFAULT_THRESHOLD = 0.25
+
+def result(name: str, params: Dict[str, Any], metrics: Dict[str, float]) -> Dict[str, Any]:
+    """
+    Build a benchmark result record.
+    
+    Args:
+        name: Benchmark name
+        params: Parameters that identify this run (corpus size, dimension, ...)
+        metrics: Measured values
+        
+    Returns:
+        Result dictionary
+    """
+    return {"name": name, "params": params, "metrics": metrics}
+
+def time_calls(function: Callable[[], Any], iterations: int, warmup: Optional[int] = None, rounds: int = 5) -> Dict[str, float]:
+    """
+    Time repeated calls of a function and summarize the latencies.
+    
+    The calls are repeated for ``rounds`` rounds with garbage collection
+    paused. Throughput comes from the fastest round, the least disturbed by
+    other activity on the machine, and latency percentiles from all calls.
+    
+    Args:
+        function: Zero-argument callable to time
+        iterations: Number of timed calls per round
+        warmup: Number of untimed calls made first (defaults to one round)
+        rounds: Number of rounds
+        
+    Returns:
+        Throughput and latency percentiles in microseconds
+    """
+    for _ in range(iterations if warmup is None else warmup):
+        function()
+        
+    samples = []
+    round_means = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            round_start = len(samples)
+            for _ in range(iterations):
+                start = time.perf_counter_ns()
+                function()
+                samples.append((time.perf_counter_ns() - start) / 1000)
+            round_means.append(statistics.fmean(samples[round_start:]))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+            
+    best_us = min(round_means)
+    samples.sort()
+    return {
+        "ops_per_sec": 1e6 / best_us if best_us else float("inf"),
+        "mean_us": statistics.fmean(samples),
+        "p50_us": samples[len(samples) // 2],
+        "p95_us": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+    }
+
+def best_of(function: Callable[[], float], rounds: int = 5, warmup: int = 1) -> float:
+    """
+    Run a self-timed pass several times and keep the fastest.
+    
+    Args:
+        function: Zero-argument callable returning its elapsed seconds
+        rounds: Number of timed passes
+        warmup: Number of untimed passes made first
+        
+    Returns:
+        Smallest elapsed time in seconds
+    """
+    for _ in range(warmup):
+        function()
+    return min(function() for _ in range(rounds))
+
+def environment() -> Dict[str, str]:
+    """
+    Describe the environment the benchmarks ran in.
+    
+    Returns:
+        Python, platform and key library versions
+    """
+    info = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+    try:
+        import numpy as np
+        info["numpy"] = np.__version__
+    except ImportError:
+        pass
+    return info
+
+def quiet_logging() -> None:
+    """Silence per-call INFO logging from the components under test."""
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+
+def write_results(results: List[Dict[str, Any]], path: str) -> None:
+    """
+    Write benchmark results to a JSON file.
+    
+    Args:
+        results: Result records
+        path: Output file path
+    """
+    payload = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "environment": environment(), "results": results}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+def load_results(path: str) -> Dict[str, Any]:
+    """
+    Load a benchmark results file.
+    
+    Args:
+        path: Results file path
+        
+    Returns:
+        Parsed results payload
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def _key(record: Dict[str, Any]) -> str:
+    """Identify a result by its name and parameters."""
+    return f"{record['name']}[{json.dumps(record['params'], sort_keys=True)}]"
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compare current results against a baseline.
+    
+    Args:
+        baseline: Baseline results payload
+        current: Current results payload
+        threshold: Relative change treated as a regression (0.25 = 25%)
+        
+    Returns:
+        One row per shared metric with the relative change, whether the
+        metric is gated (see GATED_METRICS) and whether it regressed. Only
+        gated metrics can regress. The change is None when the baseline is
+        zero and the current value is not; any move in the worse direction
+        then counts as a regression.
+    """
+    baseline_by_key = {_key(record): record for record in baseline["results"]}
+    rows = []
+    for record in current["results"]:
+        previous = baseline_by_key.get(_key(record))
+        if previous is None:
+            continue
+        for metric, value in record["metrics"].items():
+            old = previous["metrics"].get(metric)
+            if old is None:
+                continue
+            higher_is_better = metric.endswith(HIGHER_IS_BETTER_SUFFIXES)
+            gated = metric in GATED_METRICS
+            if old:
+                # abs() keeps the direction right for metrics that can be negative (overhead_us)
+                change = (value - old) / abs(old)
+                regressed = change < -threshold if higher_is_better else change > threshold
+            else:
+                change = 0.0 if value == old else None
+                regressed = value < old if higher_is_better else value > old
+            rows.append({
+                "benchmark": _key(record),
+                "metric": metric,
+                "baseline": old,
+                "current": value,
+                "change": change,
+                "gated": gated,
+                "regressed": gated and regressed,
+            })
+    return rows
+
+def missing_results(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """
+    List baseline benchmarks that are absent from the current results.
+    
+    Args:
+        baseline: Baseline results payload
+        current: Current results payload
+        
+    Returns:
+        Benchmark keys present in the baseline but not in the current run
+    """
+    current_keys = {_key(record) for record in current["results"]}
+    return [_key(record) for record in baseline["results"] if _key(record) not in current_keys]
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    """
+    Render comparison rows as a text table.
+    
+    Args:
+        rows: Rows returned by compare
+        
+    Returns:
+        Table text
+    """
+    lines = [f"{'benchmark':<60} {'metric':<14} {'baseline':>12} {'current':>12} {'change':>8}"]
+    for row in rows:
+        flag = "  REGRESSED" if row["regressed"] else ("" if row["gated"] else "  (not gated)")
+        change = "changed" if row["change"] is None else f"{row['change']:+.1%}"
+        lines.append(
+            f"{row['benchmark']:<60} {row['metric']:<14} {row['baseline']:>12.2f} "
+            f"{row['current']:>12.2f} {change:>8}{flag}"
+        )
+    return "\n".join(lines)
+
+def format_results(results: List[Dict[str, Any]]) -> str:
+    """
+    Render results as a text table.
+    
+    Args:
+        results: Result records
+        
+    Returns:
+        Table text
+    """
+    lines = []
+    for record in results:
+        metrics = "  ".join(f"{name}={value:.2f}" for name, value in record["metrics"].items())
+        lines.append(f"{_key(record):<60} {metrics}")
+    return "\n".join(lines)
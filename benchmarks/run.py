@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""
+Benchmark Runner
+
+Runs the offline benchmark suite and compares results against a saved
+baseline.
+
+Usage:
+    python benchmarks/run.py run [--quick] [--only vector_store,tools] [--output PATH] [--baseline PATH]
+    python benchmarks/run.py compare BASELINE CURRENT [--threshold 0.25]
+
+``compare`` (and ``run --baseline``) exit with status 1 when any gated
+metric (best-of-rounds throughput, median latency, recall) regressed by more
+than the threshold. Other metrics are shown but never fail the comparison.
+The default threshold sits above the run-to-run noise measured on a shared
+VM (see ``harness.DEFAULT_THRESHOLD``); compare results from the same
+machine, and lower it on dedicated hardware.
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+
+import harness
+
+SUITES = ("vector_store", "ingestion", "tools", "workflow", "coordinator")
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+def run_suites(names, quick=False):
+    """
+    Run the named benchmark suites.
+    
+    Args:
+        names: Suite names from SUITES
+        quick: Use each suite's reduced parameter grid
+        
+    Returns:
+        Result records from all suites
+    """
+    results = []
+    for name in names:
+        module = importlib.import_module(f"bench_{name}")
+        start = time.perf_counter()
+        suite_results = module.run(quick=quick)
+        print(f"{name}: {len(suite_results)} results in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+        results.extend(suite_results)
+    return results
+
+def report_comparison(baseline, current, threshold):
+    """
+    Print a comparison table and return the process exit status.
+    
+    Args:
+        baseline: Baseline results payload
+        current: Current results payload
+        threshold: Relative change treated as a regression
+        
+    Returns:
+        1 if any metric regressed, 0 otherwise
+    """
+    rows = harness.compare(baseline, current, threshold)
+    print(harness.format_comparison(rows))
+    missing = harness.missing_results(baseline, current)
+    if missing:
+        print(f"\n{len(missing)} baseline benchmark(s) missing from the current results:")
+        for key in missing:
+            print(f"  {key}")
+    regressions = [row for row in rows if row["regressed"]]
+    print(f"\n{len(regressions)} regression(s) beyond {threshold:.0%} across {len(rows)} compared metrics")
+    return 1 if regressions else 0
+
+def main():
+    """Entry point for the benchmark runner."""
+    parser = argparse.ArgumentParser(description="The Sandbox benchmark suite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    run_parser = subparsers.add_parser("run", help="run benchmarks and write results as JSON")
+    run_parser.add_argument("--quick", action="store_true", help="use reduced parameter grids")
+    run_parser.add_argument("--only", help=f"comma-separated suites to run ({', '.join(SUITES)})")
+    run_parser.add_argument("--output", help="results file (default: benchmarks/results/<timestamp>.json)")
+    run_parser.add_argument("--baseline", help="baseline results file to compare against")
+    run_parser.add_argument("--threshold", type=float, default=harness.DEFAULT_THRESHOLD,
+                            help=f"regression threshold (default {harness.DEFAULT_THRESHOLD})")
+                            
+    compare_parser = subparsers.add_parser("compare", help="compare two results files")
+    compare_parser.add_argument("baseline", help="baseline results file")
+    compare_parser.add_argument("current", help="current results file")
+    compare_parser.add_argument("--threshold", type=float, default=harness.DEFAULT_THRESHOLD,
+                                help=f"regression threshold (default {harness.DEFAULT_THRESHOLD})")
+                                
+    args = parser.parse_args()
+    
+    if args.command == "compare":
+        return report_comparison(harness.load_results(args.baseline), harness.load_results(args.current), args.threshold)
+        
+    names = args.only.split(",") if args.only else list(SUITES)
+    unknown = set(names) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suites: {', '.join(sorted(unknown))}")
+        
+    harness.quiet_logging()
+    results = run_suites(names, quick=args.quick)
+    print(harness.format_results(results))
+    
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}.json")
+    harness.write_results(results, output)
+    print(f"\nResults written to {output}")
+    
+    if args.baseline:
+        print()
+        return report_comparison(harness.load_results(args.baseline), harness.load_results(output), args.threshold)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
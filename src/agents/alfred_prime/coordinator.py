@@ -5,9 +5,13 @@ This module implements the main coordinator agent that orchestrates the workflow
 between specialized agents in the Batman & Alfred Multi-Agent Framework.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
 import logging
 
+from .routing import CapabilityIndex, task_text
+from ..utils.context_memory import ContextMemory
+from core.monitoring.metrics import get_metrics, timed
+
 logger = logging.getLogger(__name__)
 
 class AlfredPrime:
@@ -21,11 +25,21 @@ class AlfredPrime:
         Initialize the Alfred Prime coordinator agent.
         
         Args:
-            config: Configuration dictionary for the agent
+            config: Configuration dictionary for the agent. Routing options:
+                ``routing_confidence_threshold`` (keyword index, default 0.5),
+                ``embedding_confidence_threshold`` (centroid matcher, default 0.75),
+                ``embedding_function`` (callable text -> vector) and
+                ``llm_router`` (callable (task, agent_ids) -> agent_ids) used
+                for low-confidence tasks. ``context_memory`` holds keyword
+                arguments for the shared ContextMemory.
         """
         self.config = config or {}
         self.specialized_agents = {}
-        self.context = {}
+        self.context = ContextMemory(**self.config.get("context_memory", {}))
+        self.routing_index = CapabilityIndex(self.config.get("embedding_function"))
+        self.routing_threshold = self.config.get("routing_confidence_threshold", 0.5)
+        self.embedding_threshold = self.config.get("embedding_confidence_threshold", 0.75)
+        self.llm_router = self.config.get("llm_router")
         logger.info("Alfred Prime initialized")
     
     def register_agent(self, agent_id: str, agent_instance: Any) -> None:
@@ -37,8 +51,63 @@ class AlfredPrime:
             agent_instance: Instance of the specialized agent
         """
         self.specialized_agents[agent_id] = agent_instance
+        self.routing_index.add_agent(
+            agent_id,
+            getattr(agent_instance, "capabilities", []),
+            getattr(agent_instance, "keywords", [])
+        )
+        if hasattr(agent_instance, "attach_shared_context"):
+            agent_instance.attach_shared_context(self.context)
         logger.info(f"Registered agent: {agent_id}")
     
+    def route_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Select the agents that should handle a task.
+        
+        Explicit targets and declared capabilities are resolved directly, then
+        the keyword index and embedding centroids are tried. The LLM router is
+        only consulted when neither local matcher is confident enough; if it
+        returns no known agent, the keyword index's best guess is used. A tie
+        between agents has no best guess, so it is left unrouted rather than
+        sent to whichever tied agent was registered first.
+        
+        Args:
+            task: Task description and parameters
+            
+        Returns:
+            Routing decision with the selected agent IDs, confidence and method
+        """
+        if task.get("agent_ids"):
+            agent_ids = [a for a in task["agent_ids"] if a in self.specialized_agents]
+            return {"agent_ids": agent_ids, "confidence": 1.0, "method": "explicit"}
+            
+        if task.get("capabilities"):
+            agent_ids = self.routing_index.match_capabilities(task["capabilities"])
+            if agent_ids:
+                return {"agent_ids": agent_ids, "confidence": 1.0, "method": "capability"}
+                
+        text = task_text(task)
+        best_id, confidence = self.routing_index.best_match(text)
+        best_guess = None
+        if best_id is not None and confidence > 0:
+            best_guess = {"agent_ids": [best_id], "confidence": confidence, "method": "index"}
+            if confidence >= self.routing_threshold:
+                return best_guess
+                
+        similarities = self.routing_index.score_embedding(text)
+        if similarities:
+            best_id = max(similarities, key=similarities.get)
+            if similarities[best_id] >= self.embedding_threshold:
+                return {"agent_ids": [best_id], "confidence": similarities[best_id], "method": "embedding"}
+                
+        if self.llm_router is not None:
+            agent_ids = self.llm_router(task, list(self.specialized_agents))
+            agent_ids = [a for a in agent_ids if a in self.specialized_agents]
+            if agent_ids:
+                return {"agent_ids": agent_ids, "confidence": 1.0, "method": "llm"}
+            
+        return best_guess or {"agent_ids": [], "confidence": 0.0, "method": "none"}
+    
     def orchestrate(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
         Orchestrate a task across the specialized agents.
@@ -49,9 +118,56 @@ class AlfredPrime:
         Returns:
             Task results and metadata
         """
-        logger.info(f"Orchestrating task: {task.get('task_id', 'unnamed')}")
-        # Implementation will be added as the project develops
-        return {"status": "not_implemented"}
+        logger.debug(f"Orchestrating task: {task.get('task_id', 'unnamed')}")
+        with timed("orchestrate"):
+            routing = self.route_task(task)
+            get_metrics().increment("routing_decisions", method=routing["method"])
+            if not routing["agent_ids"]:
+                logger.warning("No agent matched the task")
+                return {"status": "unrouted", "routing": routing, "results": {}}
+            
+            results = {}
+            for agent_id in routing["agent_ids"]:
+                results[agent_id] = self.specialized_agents[agent_id].process(task)
+            
+            logger.debug(f"Task routed via {routing['method']} to {routing['agent_ids']}")
+            return {"status": "completed", "routing": routing, "results": results}
+    
+    def orchestrate_stream(self, task: Dict[str, Any]) -> Iterator[str]:
+        """
+        Orchestrate a task and stream the routed agents' responses.
+        
+        The recorded latency covers the whole stream, including time the
+        consumer spends between chunks.
+        
+        Args:
+            task: Task description and parameters
+            
+        Yields:
+            Response text chunks, agent by agent. When several agents are
+            routed, each agent's response starts with a bold ``agent_id``
+            header and responses are separated by a blank line.
+        """
+        logger.debug(f"Streaming task: {task.get('task_id', 'unnamed')}")
+        with timed("orchestrate_stream"):
+            routing = self.route_task(task)
+            get_metrics().increment("routing_decisions", method=routing["method"])
+            if not routing["agent_ids"]:
+                logger.warning("No agent matched the task")
+                return
+            
+            labelled = len(routing["agent_ids"]) > 1
+            for i, agent_id in enumerate(routing["agent_ids"]):
+                agent = self.specialized_agents[agent_id]
+                if labelled:
+                    separator = "\n\n" if i else ""
+                    yield f"{separator}**{agent_id}**: "
+                if hasattr(agent, "stream"):
+                    yield from agent.stream(task)
+                else:
+                    result = agent.process(task)
+                    yield str(result.get("response", result))
+            logger.debug(f"Task streamed via {routing['method']} from {routing['agent_ids']}")
     
     def create_workflow(self, workflow_definition: Dict[str, Any]) -> str:
         """
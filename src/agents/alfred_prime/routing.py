@@ -0,0 +1,216 @@
+"""
+Capability Routing for Alfred Prime
+
+This module implements the local routing index that Alfred Prime uses to pick
+specialized agents for a task without spending an LLM call on the decision.
+"""
+
+from typing import Dict, List, Any, Optional, Callable, Iterable, Set, Tuple
+import logging
+import math
+import re
+
+logger = logging.getLogger(__name__)
+
+# Words that carry no routing signal and would otherwise match every agent
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "for",
+    "from", "how", "i", "in", "is", "it", "me", "my", "of", "on", "or",
+    "please", "the", "this", "to", "what", "with", "you", "your",
+})
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase routing tokens, dropping stopwords.
+    
+    Args:
+        text: Free-form text to tokenize
+        
+    Returns:
+        List of routing tokens
+    """
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+def task_text(task: Dict[str, Any]) -> str:
+    """
+    Extract the routable text from a task dictionary.
+    
+    Args:
+        task: Task description and parameters
+        
+    Returns:
+        Concatenated text of the task's descriptive fields
+    """
+    fields = ("description", "query", "message", "content")
+    return " ".join(str(task[field]) for field in fields if task.get(field))
+
+class CapabilityIndex:
+    """
+    Inverted index from capability/keyword tokens to agent IDs, with an
+    optional embedding-centroid matcher for tasks the keywords do not cover.
+    """
+    
+    def __init__(self, embedding_function: Optional[Callable[[str], List[float]]] = None):
+        """
+        Initialize the capability index.
+        
+        Args:
+            embedding_function: Optional callable that embeds a text string
+        """
+        self.embedding_function = embedding_function
+        self.index: Dict[str, Set[str]] = {}
+        self.capabilities: Dict[str, Set[str]] = {}
+        self.agent_tokens: Dict[str, Set[str]] = {}
+        self.centroids: Dict[str, List[float]] = {}
+    
+    def add_agent(self, agent_id: str, capabilities: Iterable[str], keywords: Iterable[str] = ()) -> None:
+        """
+        Index an agent under its declared capabilities and keywords.
+        
+        Args:
+            agent_id: Unique identifier for the agent
+            capabilities: Capability names declared by the agent
+            keywords: Additional keywords that should route to the agent
+        """
+        if agent_id in self.agent_tokens:
+            self.remove_agent(agent_id)
+            
+        capabilities = [c.lower() for c in capabilities]
+        keywords = [k.lower() for k in keywords]
+        tokens = set()
+        for phrase in capabilities + keywords:
+            tokens.update(tokenize(phrase))
+            
+        self.capabilities[agent_id] = set(capabilities)
+        self.agent_tokens[agent_id] = tokens
+        for token in tokens:
+            self.index.setdefault(token, set()).add(agent_id)
+            
+        if self.embedding_function is not None and (capabilities or keywords):
+            try:
+                self.centroids[agent_id] = self._centroid(
+                    [self.embedding_function(phrase) for phrase in capabilities + keywords]
+                )
+            except Exception as e:
+                logger.warning(f"Failed to embed capabilities for agent {agent_id}: {e}")
+                
+        logger.debug(f"Indexed agent {agent_id} under {len(tokens)} routing tokens")
+    
+    def remove_agent(self, agent_id: str) -> None:
+        """
+        Remove an agent from the index.
+        
+        Args:
+            agent_id: Unique identifier for the agent
+        """
+        for token in self.agent_tokens.pop(agent_id, set()):
+            agents = self.index.get(token)
+            if agents is not None:
+                agents.discard(agent_id)
+                if not agents:
+                    del self.index[token]
+        self.capabilities.pop(agent_id, None)
+        self.centroids.pop(agent_id, None)
+    
+    def match_capabilities(self, capabilities: Iterable[str]) -> List[str]:
+        """
+        Find agents that declare all of the requested capabilities.
+        
+        Args:
+            capabilities: Capability names required by the task
+            
+        Returns:
+            List of matching agent IDs
+        """
+        required = {c.lower() for c in capabilities}
+        return [agent_id for agent_id, declared in self.capabilities.items() if required <= declared]
+    
+    def _token_weight(self, token: str) -> float:
+        """IDF weight of a token; tokens no agent declares weigh as much as the rarest."""
+        total_agents = len(self.agent_tokens)
+        agents = self.index.get(token)
+        return math.log(1 + total_agents / (len(agents) if agents else 1))
+    
+    def score_text(self, text: str) -> Dict[str, float]:
+        """
+        Score agents against free-form text using IDF-weighted token matches.
+        
+        Args:
+            text: Text to route
+            
+        Returns:
+            Mapping of agent ID to match score, only for agents with a match
+        """
+        scores: Dict[str, float] = {}
+        for token in set(tokenize(text)):
+            agents = self.index.get(token)
+            if not agents:
+                continue
+            weight = self._token_weight(token)
+            for agent_id in agents:
+                scores[agent_id] = scores.get(agent_id, 0.0) + weight
+        return scores
+    
+    def best_match(self, text: str) -> Tuple[Optional[str], float]:
+        """
+        Pick the best-scoring agent for free-form text and rate the match.
+        
+        Confidence is the product of coverage (the best agent's matched
+        weight over the query's total token weight) and margin (how far the
+        best score is ahead of the runner-up, relative to the best). A tie
+        therefore has zero confidence, and a single incidental token in a
+        longer query has low confidence.
+        
+        Args:
+            text: Text to route
+            
+        Returns:
+            Best agent ID (None if nothing matched) and confidence in [0, 1]
+        """
+        scores = self.score_text(text)
+        if not scores:
+            return None, 0.0
+        
+        ranked = sorted(scores.values(), reverse=True)
+        best_id = max(scores, key=scores.get)
+        best = ranked[0]
+        runner_up = ranked[1] if len(ranked) > 1 else 0.0
+        query_weight = sum(self._token_weight(token) for token in set(tokenize(text)))
+        coverage = best / query_weight if query_weight else 0.0
+        margin = (best - runner_up) / best
+        return best_id, coverage * margin
+    
+    def score_embedding(self, text: str) -> Dict[str, float]:
+        """
+        Score agents by cosine similarity between the text and each agent's
+        capability centroid.
+        
+        Args:
+            text: Text to route
+            
+        Returns:
+            Mapping of agent ID to cosine similarity, empty if no embedder
+        """
+        if self.embedding_function is None or not self.centroids:
+            return {}
+        try:
+            query = self.embedding_function(text)
+        except Exception as e:
+            logger.warning(f"Failed to embed routing query: {e}")
+            return {}
+        return {agent_id: self._cosine(query, centroid) for agent_id, centroid in self.centroids.items()}
+    
+    @staticmethod
+    def _centroid(vectors: List[List[float]]) -> List[float]:
+        """Compute the element-wise mean of a list of vectors."""
+        count = len(vectors)
+        return [sum(values) / count for values in zip(*vectors)]
+    
+    @staticmethod
+    def _cosine(a: List[float], b: List[float]) -> float:
+        """Compute the cosine similarity between two vectors."""
+        dot = sum(x * y for x, y in zip(a, b))
+        norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        return dot / norm if norm else 0.0
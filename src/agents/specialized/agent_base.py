@@ -5,10 +5,12 @@ This module provides the base class for all specialized agents in the
 Batman & Alfred Multi-Agent Framework.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
 import logging
 from abc import ABC, abstractmethod
 
+from ..utils.context_memory import ContextMemory
+
 logger = logging.getLogger(__name__)
 
 class SpecializedAgent(ABC):
@@ -19,18 +21,29 @@ class SpecializedAgent(ABC):
     orchestrated by Alfred Prime to complete complex workflows.
     """
     
-    def __init__(self, agent_id: str, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, 
+                agent_id: str, 
+                config: Optional[Dict[str, Any]] = None,
+                capabilities: Optional[List[str]] = None,
+                keywords: Optional[List[str]] = None):
         """
         Initialize the specialized agent.
         
         Args:
             agent_id: Unique identifier for this agent instance
             config: Configuration dictionary for the agent
+            capabilities: Capabilities this agent declares for routing
+            keywords: Additional keywords that should route tasks to this agent
+            
+        The optional ``context_memory`` config entry holds keyword arguments
+        for the agent's ContextMemory (e.g. ``max_tokens``, ``max_entries``).
         """
         self.agent_id = agent_id
         self.config = config or {}
+        self.capabilities = list(capabilities or self.config.get("capabilities", []))
+        self.keywords = list(keywords or self.config.get("keywords", []))
         self.tools = []
-        self.context = {}
+        self.context = ContextMemory(**self.config.get("context_memory", {}))
         logger.info(f"Specialized agent {agent_id} initialized")
     
     def register_tool(self, tool: Any) -> None:
@@ -56,6 +69,23 @@ class SpecializedAgent(ABC):
         """
         pass
     
+    def stream(self, task: Dict[str, Any]) -> Iterator[str]:
+        """
+        Process a task and yield the response incrementally.
+        
+        The default implementation yields the full response from ``process``
+        in one chunk; agents backed by a streaming LLM client should override
+        it to yield tokens as they arrive.
+        
+        Args:
+            task: Task description and parameters
+            
+        Yields:
+            Response text chunks
+        """
+        result = self.process(task)
+        yield str(result.get("response", result))
+    
     def update_context(self, context_updates: Dict[str, Any]) -> None:
         """
         Update the agent's context with new information.
@@ -65,3 +95,16 @@ class SpecializedAgent(ABC):
         """
         self.context.update(context_updates)
         logger.debug(f"Updated context for agent {self.agent_id}")
+    
+    def attach_shared_context(self, shared_context: ContextMemory) -> None:
+        """
+        Layer the agent's context over a shared context without copying it.
+        
+        Reads fall through to the shared context while updates stay local
+        to this agent.
+        
+        Args:
+            shared_context: Context memory owned by the coordinator
+        """
+        self.context.parent = shared_context
+        logger.debug(f"Attached shared context to agent {self.agent_id}")
@@ -0,0 +1,238 @@
+"""
+Context Memory for Agents
+
+This module provides a bounded, token-budgeted context store shared between
+Alfred Prime and the specialized agents in the Batman & Alfred Multi-Agent Framework.
+"""
+
+from typing import Dict, List, Any, Optional, Callable, Iterator, Set, Tuple
+from collections import OrderedDict
+from collections.abc import MutableMapping
+import logging
+
+logger = logging.getLogger(__name__)
+
+def estimate_tokens(value: Any) -> int:
+    """
+    Roughly estimate the number of prompt tokens a value occupies.
+    
+    Args:
+        value: Any context value
+        
+    Returns:
+        Approximate token count (about four characters per token)
+    """
+    return len(str(value)) // 4 + 1
+
+class ContextMemory(MutableMapping):
+    """
+    Dictionary-like context store with a token budget and sliding window.
+    
+    Entries are kept in insertion/update order. When the token budget or the
+    entry limit is exceeded, the oldest entries are evicted and, if a
+    summarizer is configured, folded into a running summary. The most
+    recently written entry is never evicted; a single value larger than the
+    budget is kept and logged as a warning.
+    
+    A memory may have a parent: reads fall through to the parent while writes
+    stay local, so the coordinator's context is shared with agents without
+    copying. Deleting a parent-only key from a view hides it in that view
+    only, and so does evicting a local entry that overrode a parent key.
+    Budgets are per memory, so everything visible through a view is bounded
+    by the sum of the budgets along its parent chain (see ``chain_budget``);
+    give views a smaller ``max_tokens`` to keep the total within a prompt
+    budget.
+    """
+    
+    def __init__(self,
+                max_tokens: Optional[int] = 4000,
+                max_entries: Optional[int] = None,
+                summarizer: Optional[Callable[[List[Tuple[str, Any]], Optional[str]], str]] = None,
+                token_counter: Callable[[Any], int] = estimate_tokens,
+                parent: Optional["ContextMemory"] = None):
+        """
+        Initialize the context memory.
+        
+        Args:
+            max_tokens: Token budget for local entries and summary (None for unbounded)
+            max_entries: Maximum number of local entries to retain (None for unbounded)
+            summarizer: Callable receiving evicted (key, value) pairs and the
+                previous summary, returning the new summary text
+            token_counter: Callable estimating the token size of a value
+            parent: Memory to fall back to for keys not stored locally
+        """
+        self.max_tokens = max_tokens
+        self.max_entries = max_entries
+        self.summarizer = summarizer
+        self.token_counter = token_counter
+        self.parent = parent
+        self.summary: Optional[str] = None
+        self.entries: "OrderedDict[str, Any]" = OrderedDict()
+        self.entry_tokens: Dict[str, int] = {}
+        self.total_tokens = 0
+        # Parent keys deleted through this memory, hidden from reads here
+        self.tombstones: Set[str] = set()
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self.entries:
+            return self.entries[key]
+        if self.parent is not None and key not in self.tombstones:
+            return self.parent[key]
+        raise KeyError(key)
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._store(key, value)
+        self._enforce_budget(protected=key)
+    
+    def __delitem__(self, key: str) -> None:
+        if key in self.entries:
+            del self.entries[key]
+            self.total_tokens -= self.entry_tokens.pop(key)
+            if self.parent is not None and key in self.parent:
+                self.tombstones.add(key)
+        elif self.parent is not None and key not in self.tombstones and key in self.parent:
+            self.tombstones.add(key)
+        else:
+            raise KeyError(key)
+    
+    def __contains__(self, key: object) -> bool:
+        if key in self.entries:
+            return True
+        return self.parent is not None and key not in self.tombstones and key in self.parent
+    
+    def __iter__(self) -> Iterator[str]:
+        if self.parent is not None:
+            for key in self.parent:
+                if key not in self.entries and key not in self.tombstones:
+                    yield key
+        yield from self.entries
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Update local entries, enforcing the budget once after all writes.
+        
+        Args:
+            *args: Mapping or iterable of key/value pairs
+            **kwargs: Additional key/value pairs
+        """
+        key = None
+        for key, value in dict(*args, **kwargs).items():
+            self._store(key, value)
+        self._enforce_budget(protected=key)
+    
+    def clear(self) -> None:
+        """Remove all local entries, tombstones and the summary, leaving the parent untouched."""
+        self.entries.clear()
+        self.entry_tokens.clear()
+        self.total_tokens = 0
+        self.tombstones.clear()
+        self.summary = None
+    
+    def view(self, **kwargs: Any) -> "ContextMemory":
+        """
+        Create a copy-on-write view layered over this memory.
+        
+        Args:
+            **kwargs: Budget options for the view (defaults to this memory's)
+            
+        Returns:
+            New ContextMemory whose reads fall through to this one
+        """
+        options = {
+            "max_tokens": self.max_tokens,
+            "max_entries": self.max_entries,
+            "summarizer": self.summarizer,
+            "token_counter": self.token_counter,
+        }
+        options.update(kwargs)
+        return ContextMemory(parent=self, **options)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Materialize the visible context, including parent entries.
+        
+        Summaries are not included; use ``summaries`` for those.
+        
+        Returns:
+            Plain dictionary of visible entries
+        """
+        return {key: self[key] for key in self}
+    
+    def summaries(self) -> List[str]:
+        """
+        Collect the summaries of evicted entries along the parent chain.
+        
+        Returns:
+            Non-empty summaries, outermost parent first
+        """
+        result = self.parent.summaries() if self.parent is not None else []
+        if self.summary:
+            result.append(self.summary)
+        return result
+    
+    def chain_budget(self) -> Optional[int]:
+        """
+        Get the token bound on everything visible through this memory.
+        
+        Returns:
+            Sum of ``max_tokens`` along the parent chain, or None if any is unbounded
+        """
+        if self.max_tokens is None:
+            return None
+        if self.parent is None:
+            return self.max_tokens
+        parent_budget = self.parent.chain_budget()
+        return None if parent_budget is None else parent_budget + self.max_tokens
+    
+    def _store(self, key: str, value: Any) -> None:
+        """Insert or refresh a local entry as the most recent one."""
+        if key in self.entries:
+            self.total_tokens -= self.entry_tokens[key]
+            self.entries.move_to_end(key)
+        tokens = self.token_counter(value)
+        if self.max_tokens is not None and tokens > self.max_tokens:
+            logger.warning(f"Context entry '{key}' ({tokens} tokens) exceeds the {self.max_tokens} token budget")
+        self.tombstones.discard(key)
+        self.entries[key] = value
+        self.entry_tokens[key] = tokens
+        self.total_tokens += tokens
+    
+    def _over_budget(self) -> bool:
+        """Check whether local entries exceed the token budget or window size."""
+        if self.max_entries is not None and len(self.entries) > self.max_entries:
+            return True
+        if self.max_tokens is not None:
+            summary_tokens = self.token_counter(self.summary) if self.summary else 0
+            return self.total_tokens + summary_tokens > self.max_tokens
+        return False
+    
+    def _enforce_budget(self, protected: Optional[str] = None) -> None:
+        """Evict the oldest entries until the memory fits its budget, sparing ``protected``."""
+        evicted = []
+        while self.entries and self._over_budget():
+            if next(iter(self.entries)) == protected:
+                break
+            key, value = self.entries.popitem(last=False)
+            self.total_tokens -= self.entry_tokens.pop(key)
+            # An evicted override must not expose the parent's older value
+            if self.parent is not None and key in self.parent:
+                self.tombstones.add(key)
+            evicted.append((key, value))
+            
+        if evicted and self.summarizer is not None:
+            try:
+                self.summary = self.summarizer(evicted, self.summary)
+            except Exception as e:
+                logger.warning(f"Failed to summarize evicted context: {e}")
+                
+        # Keep the summary itself within budget by trimming its oldest text
+        if self.summary and self.max_tokens is not None:
+            available = self.max_tokens - self.total_tokens
+            while self.summary and self.token_counter(self.summary) > available:
+                self.summary = self.summary[len(self.summary) // 4 + 1:] if available > 0 else None
+                
+        if evicted:
+            logger.debug(f"Evicted {len(evicted)} context entries")
@@ -0,0 +1,201 @@
+"""
+Metrics and Tracing for Hot Paths
+
+This module provides a lightweight instrumentation layer for the Batman & Alfred
+Multi-Agent Framework. Metrics go to a no-op backend by default and can be
+exported through prometheus-client when it is installed. prometheus-client is
+only imported once Prometheus export is enabled, so the default backend adds
+nothing to start-up time.
+"""
+
+from typing import Dict, Any, Optional, Tuple, Iterator
+from types import SimpleNamespace
+from contextlib import contextmanager
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket bounds in seconds, log-scale from 10 us to 10 s, so the
+# microsecond-scale hot paths (routing, tool calls) land in distinct buckets
+LATENCY_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+class NoOpMetrics:
+    """Metrics backend that discards every measurement."""
+    
+    def observe_latency(self, name: str, seconds: float, **labels: str) -> None:
+        """Record a latency observation in seconds."""
+    
+    def increment(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        """Increment a counter."""
+    
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        """Set a gauge to the given value."""
+
+class PrometheusMetrics(NoOpMetrics):
+    """
+    Metrics backend that records measurements with prometheus-client.
+    
+    Metric objects are created on first use, named ``<namespace>_<name>_seconds``
+    for latencies and ``<namespace>_<name>_total`` for counters. The label
+    names seen on first use are fixed for that metric; later calls must pass
+    the same label names.
+    """
+    
+    def __init__(self, namespace: str = "sandbox", registry: Optional[Any] = None):
+        """
+        Initialize the Prometheus backend.
+        
+        Args:
+            namespace: Prefix for all metric names
+            registry: Prometheus collector registry (defaults to the global one)
+        """
+        import prometheus_client  # Optional dependency, raises ImportError if missing
+        
+        self.client = prometheus_client
+        self.namespace = namespace
+        self.registry = registry or prometheus_client.REGISTRY
+        self.metrics: Dict[Tuple[str, str], Any] = {}
+        self.label_names: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+    
+    def _metric(self, kind: str, name: str, labels: Dict[str, str]) -> Any:
+        """
+        Get or create the metric for a name, bound to the given labels.
+        
+        Raises:
+            ValueError: If the label names differ from the metric's first use
+        """
+        key = (kind, name)
+        metric = self.metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self.metrics.get(key)
+                if metric is None:
+                    metric_class, suffix = {
+                        "histogram": (self.client.Histogram, "_seconds"),
+                        "counter": (self.client.Counter, ""),
+                        "gauge": (self.client.Gauge, ""),
+                    }[kind]
+                    options = {"buckets": LATENCY_BUCKETS} if kind == "histogram" else {}
+                    metric = metric_class(
+                        f"{name}{suffix}",
+                        f"{kind.capitalize()} for {name.replace('_', ' ')}",
+                        labelnames=sorted(labels),
+                        namespace=self.namespace,
+                        registry=self.registry,
+                        **options
+                    )
+                    self.metrics[key] = metric
+                    self.label_names[key] = tuple(sorted(labels))
+        if tuple(sorted(labels)) != self.label_names[key]:
+            raise ValueError(
+                f"Metric '{name}' uses labels {list(self.label_names[key])}, got {sorted(labels)}"
+            )
+        return metric.labels(**labels) if labels else metric
+    
+    def observe_latency(self, name: str, seconds: float, **labels: str) -> None:
+        """Record a latency observation in seconds."""
+        self._metric("histogram", name, labels).observe(seconds)
+    
+    def increment(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        """Increment a counter."""
+        self._metric("counter", name, labels).inc(amount)
+    
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        """Set a gauge to the given value."""
+        self._metric("gauge", name, labels).set(value)
+
+_metrics: NoOpMetrics = NoOpMetrics()
+
+def get_metrics() -> NoOpMetrics:
+    """
+    Get the active metrics backend.
+    
+    Returns:
+        The configured metrics backend (no-op unless one was configured)
+    """
+    return _metrics
+
+def configure_metrics(backend: NoOpMetrics) -> None:
+    """
+    Set the metrics backend used by all instrumented components.
+    
+    Args:
+        backend: Metrics backend instance
+    """
+    global _metrics
+    _metrics = backend
+    logger.info(f"Metrics backend set to {backend.__class__.__name__}")
+
+def enable_prometheus(port: Optional[int] = None, namespace: str = "sandbox") -> bool:
+    """
+    Switch to the Prometheus backend and optionally serve the metrics endpoint.
+    
+    Args:
+        port: Port for the /metrics HTTP endpoint (no server if None)
+        namespace: Prefix for all metric names
+        
+    Returns:
+        True if Prometheus export is enabled, False if prometheus-client is missing
+    """
+    try:
+        backend = PrometheusMetrics(namespace)
+    except ImportError:
+        logger.warning("prometheus-client not installed; metrics stay disabled")
+        return False
+    configure_metrics(backend)
+    if port is not None:
+        backend.client.start_http_server(port)
+        logger.info(f"Serving Prometheus metrics on port {port}")
+    return True
+
+@contextmanager
+def timed(name: str, **labels: str) -> Iterator[SimpleNamespace]:
+    """
+    Time a block and record its latency and outcome.
+    
+    Records ``<name>`` latency and increments ``<name>_calls`` labelled with
+    ``status``. The status is ``error`` if the block raises; blocks that
+    handle failures themselves can set ``status`` on the yielded object.
+    
+    Args:
+        name: Metric name for the operation
+        **labels: Additional metric labels (keep these low-cardinality)
+    """
+    start = time.perf_counter()
+    outcome = SimpleNamespace(status="ok")
+    try:
+        yield outcome
+    except Exception:
+        outcome.status = "error"
+        raise
+    finally:
+        metrics = _metrics
+        metrics.observe_latency(name, time.perf_counter() - start, **labels)
+        metrics.increment(f"{name}_calls", status=outcome.status, **labels)
+
+def record_cache(cache: str, hit: bool) -> None:
+    """
+    Count a cache lookup; the hit ratio is hits / (hits + misses).
+    
+    Args:
+        cache: Name of the cache
+        hit: Whether the lookup was a hit
+    """
+    _metrics.increment("cache_hits" if hit else "cache_misses", cache=cache)
+
+def set_queue_depth(queue: str, depth: int) -> None:
+    """
+    Record the current depth of a queue.
+    
+    Args:
+        queue: Name of the queue
+        depth: Number of items currently queued or in flight
+    """
+    _metrics.set_gauge("queue_depth", depth, queue=queue)
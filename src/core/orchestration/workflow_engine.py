@@ -9,6 +9,8 @@ from typing import Dict, List, Any, Optional
 import logging
 from enum import Enum
 
+from core.monitoring.metrics import timed, set_queue_depth
+
 logger = logging.getLogger(__name__)
 
 class WorkflowStatus(Enum):
@@ -69,8 +71,10 @@ class WorkflowEngine:
             raise ValueError(f"Workflow {workflow_id} not found")
         
         # Implementation will be added as the project develops
-        self.workflows[workflow_id]["status"] = WorkflowStatus.RUNNING
-        self.active_workflows.add(workflow_id)
+        with timed("workflow_step"):
+            self.workflows[workflow_id]["status"] = WorkflowStatus.RUNNING
+            self.active_workflows.add(workflow_id)
+            set_queue_depth("active_workflows", len(self.active_workflows))
         
         logger.info(f"Started execution of workflow: {workflow_id}")
         return f"exec_{workflow_id}"
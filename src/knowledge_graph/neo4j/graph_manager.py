@@ -9,6 +9,8 @@ from typing import Dict, List, Any, Optional, Union
 import logging
 import os
 
+from core.monitoring.metrics import timed
+
 logger = logging.getLogger(__name__)
 
 class Neo4jGraphManager:
@@ -92,6 +94,7 @@ class Neo4jGraphManager:
         Returns:
             Query results
         """
-        # Implementation will be added as the project develops
-        logger.info("Executed Cypher query")
-        return []
+        with timed("graph_query"):
+            # Implementation will be added as the project develops
+            logger.debug("Executed Cypher query")
+            return []
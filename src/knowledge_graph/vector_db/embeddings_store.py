@@ -10,6 +10,8 @@ import logging
 import os
 import numpy as np
 
+from core.monitoring.metrics import timed
+
 logger = logging.getLogger(__name__)
 
 class VectorStore:
@@ -47,22 +49,25 @@ class VectorStore:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            # Convert to numpy array for consistency
-            if not isinstance(embedding, np.ndarray):
-                embedding = np.array(embedding, dtype=np.float32)
-            
-            if embedding.shape[0] != self.dimension:
-                logger.warning(f"Embedding dimension mismatch: expected {self.dimension}, got {embedding.shape[0]}")
+        with timed("vector_add_embedding") as outcome:
+            try:
+                # Convert to numpy array for consistency
+                if not isinstance(embedding, np.ndarray):
+                    embedding = np.array(embedding, dtype=np.float32)
+                
+                if embedding.shape[0] != self.dimension:
+                    logger.warning(f"Embedding dimension mismatch: expected {self.dimension}, got {embedding.shape[0]}")
+                    outcome.status = "error"
+                    return False
+                
+                self.vectors[text_id] = embedding
+                self.metadata[text_id] = metadata or {}
+                logger.debug(f"Added embedding for text_id: {text_id}")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to add embedding: {e}")
+                outcome.status = "error"
                 return False
-            
-            self.vectors[text_id] = embedding
-            self.metadata[text_id] = metadata or {}
-            logger.info(f"Added embedding for text_id: {text_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to add embedding: {e}")
-            return False
     
     def search(self, 
               query_embedding: Union[List[float], np.ndarray], 
@@ -77,14 +82,15 @@ class VectorStore:
         Returns:
             List of top matches with scores and metadata
         """
-        if not self.vectors:
-            logger.warning("Vector store is empty")
-            return []
-        
-        # Implementation will be added as the project develops
-        # This would compute cosine similarity or other distance metrics
-        logger.info(f"Performed vector search, returning {top_k} results")
-        return [{"text_id": "placeholder", "score": 0.95, "metadata": {}}]
+        with timed("vector_search"):
+            if not self.vectors:
+                logger.warning("Vector store is empty")
+                return []
+            
+            # Implementation will be added as the project develops
+            # This would compute cosine similarity or other distance metrics
+            logger.debug(f"Performed vector search, returning {top_k} results")
+            return [{"text_id": "placeholder", "score": 0.95, "metadata": {}}]
     
     def delete_embedding(self, text_id: str) -> bool:
         """
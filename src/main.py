@@ -5,36 +5,250 @@ This file orchestrates the initialization and execution of the Batman & Alfred M
 """
 
 import os
+import sys
+import atexit
+import argparse
+import importlib
+import queue
+import subprocess
+import threading
 import logging
+import logging.handlers
 from dotenv import load_dotenv
 
+from core.monitoring.metrics import enable_prometheus, record_cache
+
 # Load environment variables
 load_dotenv()
 
-# Configure logging
+# Configure logging. Records are handed to a queue and written by a listener
+# thread, so hot paths never block on file or console I/O.
+_log_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+_log_handlers = [logging.FileHandler("app.log"), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("app.log"),
-        logging.StreamHandler()
-    ]
+    format="%(message)s",  # Full formatting happens in the listener's handlers
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
-def initialize_app():
-    """Initialize the application components."""
+# Subsystems are imported and constructed on first use, so start-up only pays
+# for the heavyweight dependencies (gradio, numpy, ...) a run actually touches.
+SUBSYSTEMS = {
+    "coordinator": ("agents.alfred_prime.coordinator", "AlfredPrime"),
+    "workflow_engine": ("core.orchestration.workflow_engine", "WorkflowEngine"),
+    "tool_registry": ("tools.api_integrations.tool_registry", "ToolRegistry"),
+    "vector_store": ("knowledge_graph.vector_db.embeddings_store", "VectorStore"),
+    "graph_manager": ("knowledge_graph.neo4j.graph_manager", "Neo4jGraphManager"),
+    "ui": ("ui.gradio.app", "create_ui"),
+}
+
+# Config keys filled with other subsystems when a subsystem is built, unless
+# the caller's config already sets them
+SUBSYSTEM_DEPENDENCIES = {
+    "ui": {"coordinator": "coordinator"},
+}
+
+class LazyComponents:
+    """Container that imports and initializes subsystems on first access."""
+    
+    def __init__(self, config=None):
+        """
+        Initialize the component container without loading any subsystem.
+        
+        Args:
+            config: Mapping of subsystem name to its configuration dictionary
+        """
+        self.config = config or {}
+        self.components = {}
+        self.warm_up_thread = None
+        # Re-entrant so building a subsystem can load its dependencies
+        self._lock = threading.RLock()
+    
+    def get(self, name):
+        """
+        Get a subsystem, importing and initializing it if needed.
+        
+        Args:
+            name: Subsystem name from SUBSYSTEMS
+            
+        Returns:
+            Initialized subsystem instance
+        """
+        if name in self.components:
+            record_cache("subsystems", hit=True)
+            return self.components[name]
+        record_cache("subsystems", hit=False)
+        
+        with self._lock:
+            if name not in self.components:
+                if name not in SUBSYSTEMS:
+                    raise ValueError(f"Unknown subsystem: {name}")
+                module_name, factory_name = SUBSYSTEMS[name]
+                factory = getattr(importlib.import_module(module_name), factory_name)
+                subsystem_config = self.config.get(name)
+                dependencies = SUBSYSTEM_DEPENDENCIES.get(name, {})
+                if dependencies:
+                    subsystem_config = dict(subsystem_config or {})
+                    for key, dependency in dependencies.items():
+                        if key not in subsystem_config:
+                            subsystem_config[key] = self.get(dependency)
+                self.components[name] = factory(subsystem_config) if subsystem_config is not None else factory()
+                logger.info(f"Loaded subsystem: {name}")
+        return self.components[name]
+    
+    def warm_up(self, names=None):
+        """
+        Load subsystems in a background daemon thread.
+        
+        Args:
+            names: Subsystem names to load (defaults to all)
+            
+        Returns:
+            The started warm-up thread
+        """
+        names = list(names or SUBSYSTEMS)
+        
+        def _load():
+            for name in names:
+                try:
+                    self.get(name)
+                except Exception as e:
+                    logger.warning(f"Failed to warm up subsystem {name}: {e}")
+                    
+        thread = threading.Thread(target=_load, name="subsystem-warm-up", daemon=True)
+        thread.start()
+        self.warm_up_thread = thread
+        return thread
+
+# Modules main.py imports at start-up, profiled alongside the subsystems
+EAGER_IMPORTS = (
+    "argparse", "importlib", "queue", "subprocess", "threading",
+    "logging.handlers", "dotenv", "core.monitoring.metrics",
+)
+
+# Run in the profiling interpreter: import each module, reporting failures
+# without stopping, so one broken subsystem doesn't hide the rest
+_PROFILE_SCRIPT = """
+import importlib, sys
+for name in sys.argv[1:]:
+    try:
+        importlib.import_module(name)
+    except Exception as e:
+        print(f"failed: {name}: {e}", file=sys.stderr)
+"""
+
+def parse_import_times(output):
+    """
+    Parse ``-X importtime`` output into per-module timings.
+    
+    Args:
+        output: Standard error of a ``python -X importtime`` run
+        
+    Returns:
+        List of (module, self_us, cumulative_us) tuples, slowest first. A
+        module reported more than once keeps its largest timings.
+    """
+    timings = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        previous = timings.get(name, (0, 0))
+        timings[name] = (max(previous[0], int(self_us)), max(previous[1], int(cumulative_us)))
+    rows = [(name, self_us, cumulative_us) for name, (self_us, cumulative_us) in timings.items()]
+    rows.sort(key=lambda timing: timing[2], reverse=True)
+    return rows
+
+def profile_imports(modules=None, top=25):
+    """
+    Report per-module import time for the given modules.
+    
+    All modules are imported in one fresh interpreter with ``-X importtime``,
+    so the numbers reflect a cold start and shared dependencies are counted
+    once, under the module that first imported them.
+    
+    Args:
+        modules: Module names to import (defaults to main's own imports
+            followed by all subsystems)
+        top: Number of slowest modules to report
+        
+    Returns:
+        List of (module, self_us, cumulative_us) tuples, slowest first
+    """
+    modules = modules or list(EAGER_IMPORTS) + [module_name for module_name, _ in SUBSYSTEMS.values()]
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROFILE_SCRIPT, *modules],
+        cwd=src_dir, capture_output=True, text=True
+    )
+    for line in result.stderr.splitlines():
+        if line.startswith("failed: "):
+            logger.warning(f"Failed to import {line[len('failed: '):]}")
+            
+    timings = parse_import_times(result.stderr)[:top]
+    print(f"{'cumulative [ms]':>16} {'self [ms]':>10}  module")
+    for name, self_us, cumulative_us in timings:
+        print(f"{cumulative_us / 1000:>16.1f} {self_us / 1000:>10.1f}  {name}")
+    return timings
+
+def initialize_app(config=None, warm_up=False):
+    """
+    Initialize the application components.
+    
+    Args:
+        config: Mapping of subsystem name to its configuration dictionary
+        warm_up: Whether to load all subsystems in a background thread
+        
+    Returns:
+        LazyComponents container for the application subsystems
+    """
     logger.info("Initializing The Sandbox application...")
-    # Import and initialize components here
-    # This will be implemented as the project develops
+    components = LazyComponents(config)
+    if warm_up:
+        components.warm_up()
+    return components
 
 def main():
     """Main entry point for the application."""
+    parser = argparse.ArgumentParser(description="The Sandbox AI application")
+    parser.add_argument("--import-profile", action="store_true",
+                        help="report per-module import time and exit")
+    parser.add_argument("--warm-up", action="store_true",
+                        default=os.getenv("SANDBOX_WARM_UP", "").lower() in ("1", "true", "yes"),
+                        help="load all subsystems in a background thread at start-up; "
+                             "without --ui, wait for them to finish loading before exiting")
+    parser.add_argument("--ui", action="store_true",
+                        help="launch the Gradio interface wired to the coordinator")
+    parser.add_argument("--metrics-port", type=int,
+                        default=int(os.getenv("METRICS_PORT")) if os.getenv("METRICS_PORT") else None,
+                        help="serve Prometheus metrics on this port")
+    args = parser.parse_args()
+    
+    if args.import_profile:
+        profile_imports()
+        return
+        
+    if args.metrics_port is not None:
+        enable_prometheus(args.metrics_port)
+        
     try:
-        initialize_app()
+        components = initialize_app(warm_up=args.warm_up)
         logger.info("The Sandbox is ready!")
-        # Main application logic will be implemented here
+        if args.ui:
+            components.get("ui").launch()
+        elif components.warm_up_thread is not None:
+            # No long-running entry point, so let warm-up finish and report failures
+            components.warm_up_thread.join()
     except Exception as e:
         logger.error(f"Error in application: {e}", exc_info=True)
 
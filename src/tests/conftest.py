@@ -0,0 +1,11 @@
+"""
+Shared pytest configuration for The Sandbox test suite.
+"""
+
+import os
+import sys
+
+# Modules import each other relative to src/, as they do when run via main.py
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
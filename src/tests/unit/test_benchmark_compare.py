@@ -0,0 +1,63 @@
+"""
+Unit tests for the benchmark baseline comparison.
+"""
+
+import os
+import sys
+
+import pytest
+
+# The benchmark harness lives outside src/, in the repository's benchmarks/
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+BENCHMARKS_DIR = os.path.join(REPO_DIR, "benchmarks")
+if BENCHMARKS_DIR not in sys.path:
+    sys.path.insert(0, BENCHMARKS_DIR)
+
+import harness
+
+def payload(*records):
+    return {"results": [harness.result(name, {}, metrics) for name, metrics in records]}
+
+def rows_by_metric(baseline, current, threshold=0.1):
+    return {row["metric"]: row for row in harness.compare(baseline, current, threshold)}
+
+def test_direction_depends_on_metric():
+    baseline = payload(("b", {"ops_per_sec": 100.0, "p50_us": 10.0}))
+    slower = rows_by_metric(baseline, payload(("b", {"ops_per_sec": 70.0, "p50_us": 13.0})))
+    assert slower["ops_per_sec"]["change"] == pytest.approx(-0.3)
+    assert slower["ops_per_sec"]["regressed"]
+    assert slower["p50_us"]["regressed"]
+    faster = rows_by_metric(baseline, payload(("b", {"ops_per_sec": 130.0, "p50_us": 7.0})))
+    assert not faster["ops_per_sec"]["regressed"]
+    assert not faster["p50_us"]["regressed"]
+
+def test_ungated_metrics_never_regress():
+    baseline = payload(("b", {"mean_us": 10.0, "p95_us": 10.0}))
+    rows = rows_by_metric(baseline, payload(("b", {"mean_us": 20.0, "p95_us": 30.0})))
+    assert rows["mean_us"]["change"] == pytest.approx(1.0)
+    assert not rows["mean_us"]["gated"]
+    assert not any(row["regressed"] for row in rows.values())
+
+def test_negative_baseline_keeps_direction():
+    rows = rows_by_metric(payload(("b", {"overhead_us": -2.0})), payload(("b", {"overhead_us": -1.0})))
+    assert rows["overhead_us"]["change"] == pytest.approx(0.5)
+    rows = rows_by_metric(payload(("b", {"overhead_us": -2.0})), payload(("b", {"overhead_us": -3.0})))
+    assert rows["overhead_us"]["change"] == pytest.approx(-0.5)
+
+def test_zero_baseline():
+    baseline = payload(("b", {"ops_per_sec": 0.0, "p50_us": 0.0, "recall": 0.0}))
+    rows = rows_by_metric(baseline, payload(("b", {"ops_per_sec": 5.0, "p50_us": 1.0, "recall": 0.0})))
+    assert rows["ops_per_sec"]["change"] is None
+    assert not rows["ops_per_sec"]["regressed"]
+    assert rows["p50_us"]["change"] is None
+    assert rows["p50_us"]["regressed"]
+    assert rows["recall"]["change"] == 0.0
+    assert not rows["recall"]["regressed"]
+    assert "changed" in harness.format_comparison(list(rows.values()))
+
+def test_missing_results_and_metrics():
+    baseline = payload(("kept", {"ops_per_sec": 1.0, "recall": 1.0}), ("dropped", {"ops_per_sec": 1.0}))
+    current = payload(("kept", {"ops_per_sec": 1.0}), ("new", {"ops_per_sec": 1.0}))
+    rows = harness.compare(baseline, current)
+    assert [(row["benchmark"], row["metric"]) for row in rows] == [("kept[{}]", "ops_per_sec")]
+    assert harness.missing_results(baseline, current) == ["dropped[{}]"]
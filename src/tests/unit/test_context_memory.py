@@ -0,0 +1,92 @@
+"""
+Unit tests for the bounded context memory.
+"""
+
+import logging
+
+import pytest
+
+from agents.utils.context_memory import ContextMemory
+
+def count_chars(value):
+    """Token counter where one character is one token, for exact budgets."""
+    return len(str(value))
+
+def test_evicts_oldest_entries_over_budget():
+    memory = ContextMemory(max_tokens=10, token_counter=count_chars)
+    memory.update({"a": "xxxx", "b": "xxxx"})
+    memory["c"] = "xxxx"
+    assert list(memory) == ["b", "c"]
+    assert memory.total_tokens == 8
+
+def test_sliding_window_keeps_last_entries():
+    memory = ContextMemory(max_tokens=None, max_entries=3)
+    memory.update({str(i): i for i in range(10)})
+    assert dict(memory) == {"7": 7, "8": 8, "9": 9}
+
+def test_oversized_write_is_kept_and_logged(caplog):
+    memory = ContextMemory(max_tokens=10)
+    memory["old"] = "x"
+    with caplog.at_level(logging.WARNING):
+        memory["a"] = "x" * 100
+    assert memory["a"] == "x" * 100
+    assert "old" not in memory
+    assert "exceeds" in caplog.text
+
+def test_evicted_entries_are_summarized():
+    memory = ContextMemory(
+        max_tokens=20,
+        token_counter=count_chars,
+        summarizer=lambda evicted, previous: ",".join(key for key, _ in evicted)
+    )
+    memory.update({"a": "x" * 8, "b": "x" * 8})
+    memory["c"] = "x" * 8
+    assert memory.summaries() == ["a"]
+    assert memory.total_tokens + count_chars(memory.summary) <= 20
+
+def test_view_reads_parent_and_writes_locally():
+    parent = ContextMemory()
+    parent["shared"] = 1
+    view = parent.view()
+    view["local"] = 2
+    assert view["shared"] == 1
+    assert "local" not in parent
+    parent["later"] = 3
+    assert view["later"] == 3
+
+def test_deleting_parent_key_through_view_hides_it_locally():
+    parent = ContextMemory()
+    parent["k"] = 1
+    view = parent.view()
+    assert view.pop("k", None) == 1
+    assert "k" not in view
+    assert view.pop("k", None) is None
+    assert parent["k"] == 1
+    with pytest.raises(KeyError):
+        del view["k"]
+    view["k"] = 2
+    assert view["k"] == 2
+
+def test_evicted_override_does_not_expose_parent_value():
+    parent = ContextMemory()
+    parent["status"] = "pending"
+    view = parent.view(max_entries=1)
+    view["status"] = "done"
+    view["other"] = 1
+    assert "status" not in view
+    with pytest.raises(KeyError):
+        view["status"]
+    assert parent["status"] == "pending"
+
+def test_snapshot_keeps_user_summary_key():
+    parent = ContextMemory(max_entries=1, summarizer=lambda evicted, previous: "parent summary")
+    parent.update({"x": 1, "y": 2})
+    view = parent.view(max_entries=None)
+    view["summary"] = "user value"
+    assert view.snapshot() == {"y": 2, "summary": "user value"}
+    assert view.summaries() == ["parent summary"]
+
+def test_chain_budget_sums_parent_budgets():
+    parent = ContextMemory(max_tokens=100)
+    assert parent.view(max_tokens=50).chain_budget() == 150
+    assert ContextMemory(max_tokens=None).view().chain_budget() is None
@@ -0,0 +1,69 @@
+"""
+Unit tests for the Gradio chat handler, driven without gradio installed.
+"""
+
+import asyncio
+import copy
+
+from agents.alfred_prime.coordinator import AlfredPrime
+from agents.specialized.agent_base import SpecializedAgent
+from ui.gradio.app import BatmanAlfredUI
+
+class FakeCoordinator:
+    """Coordinator whose stream yields fixed chunks and records being closed."""
+    
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+    
+    def orchestrate_stream(self, task):
+        try:
+            yield from self.chunks
+        finally:
+            self.closed = True
+
+class EchoAgent(SpecializedAgent):
+    """Agent that answers with its own ID."""
+    
+    def process(self, task):
+        return {"response": self.agent_id}
+
+async def collect(generator, limit=None):
+    """Snapshot up to ``limit`` yields from an async generator, then close it."""
+    outputs = []
+    async for output in generator:
+        outputs.append(copy.deepcopy(output))
+        if limit is not None and len(outputs) >= limit:
+            break
+    await generator.aclose()
+    return outputs
+
+def test_chunks_accumulate_into_history():
+    ui = BatmanAlfredUI({"coordinator": FakeCoordinator(["Hel", "lo", "!"])})
+    outputs = asyncio.run(collect(ui._process_message("hi", [["earlier", "reply"]])))
+    assert [history[-1][1] for _, history in outputs] == ["", "Hel", "Hello", "Hello!"]
+    textbox, history = outputs[-1]
+    assert textbox == ""
+    assert history == [["earlier", "reply"], ["hi", "Hello!"]]
+    assert ui.in_flight == 0
+
+def test_cancelling_closes_the_stream():
+    coordinator = FakeCoordinator(["a", "b", "c"])
+    ui = BatmanAlfredUI({"coordinator": coordinator})
+    outputs = asyncio.run(collect(ui._process_message("hi", None), limit=2))
+    assert outputs[-1][1][-1] == ["hi", "a"]
+    assert coordinator.closed
+    assert ui.in_flight == 0
+
+def test_placeholder_response_without_coordinator():
+    ui = BatmanAlfredUI()
+    _, history = asyncio.run(collect(ui._process_message("hi", None)))[-1]
+    assert history[-1][1].startswith("I'm Alfred")
+
+def test_streamed_agents_are_separated():
+    coordinator = AlfredPrime()
+    coordinator.register_agent("a", EchoAgent("a"))
+    coordinator.register_agent("b", EchoAgent("b"))
+    task = {"agent_ids": ["a", "b"]}
+    assert "".join(coordinator.orchestrate_stream(task)) == "**a**: a\n\n**b**: b"
+    assert "".join(coordinator.orchestrate_stream({"agent_ids": ["a"]})) == "a"
@@ -0,0 +1,81 @@
+"""
+Unit tests for lazy subsystem loading and the import profiler in main.py.
+"""
+
+import importlib
+import logging
+import sys
+import threading
+import types
+
+import pytest
+
+class Service:
+    """Stub subsystem that records the config it was built with."""
+    
+    def __init__(self, config=None):
+        self.config = config
+
+def broken(config=None):
+    raise RuntimeError("boom")
+
+@pytest.fixture
+def main(tmp_path, monkeypatch):
+    """Import main.py with stub subsystems; its log file goes to a temp dir."""
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module("main")
+    stub = types.ModuleType("stub_subsystems")
+    stub.Service = Service
+    stub.broken = broken
+    monkeypatch.setitem(sys.modules, "stub_subsystems", stub)
+    monkeypatch.setattr(module, "SUBSYSTEMS", {
+        "service": ("stub_subsystems", "Service"),
+        "consumer": ("stub_subsystems", "Service"),
+        "broken": ("stub_subsystems", "broken"),
+    })
+    monkeypatch.setattr(module, "SUBSYSTEM_DEPENDENCIES", {"consumer": {"service": "service"}})
+    return module
+
+def test_subsystems_load_once_on_first_access(main):
+    components = main.LazyComponents({"service": {"name": "x"}})
+    assert components.components == {}
+    service = components.get("service")
+    assert service.config == {"name": "x"}
+    assert components.get("service") is service
+    with pytest.raises(ValueError):
+        components.get("missing")
+
+def test_dependencies_are_injected_without_deadlock(main):
+    components = main.LazyComponents()
+    thread = threading.Thread(target=components.get, args=("consumer",))
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    consumer = components.get("consumer")
+    assert consumer.config["service"] is components.get("service")
+
+def test_configured_dependency_is_not_overridden(main):
+    own_service = object()
+    components = main.LazyComponents({"consumer": {"service": own_service}})
+    assert components.get("consumer").config["service"] is own_service
+    assert "service" not in components.components
+
+def test_warm_up_logs_failures_and_continues(main, caplog):
+    components = main.LazyComponents()
+    with caplog.at_level(logging.WARNING):
+        components.warm_up(["broken", "service"]).join(timeout=5)
+    assert "Failed to warm up subsystem broken: boom" in caplog.text
+    assert "service" in components.components
+
+def test_parse_import_times_merges_repeated_modules(main):
+    output = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   typing",
+        "import time:       300 |       2500 | core.monitoring.metrics",
+        "import time:        90 |        150 |   typing",
+        "failed: broken: boom",
+    ])
+    assert main.parse_import_times(output) == [
+        ("core.monitoring.metrics", 300, 2500),
+        ("typing", 120, 150),
+    ]
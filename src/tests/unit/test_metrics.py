@@ -0,0 +1,98 @@
+"""
+Unit tests for the metrics layer and the instrumented hot paths.
+"""
+
+import pytest
+
+from core.monitoring import metrics
+from core.monitoring.metrics import NoOpMetrics, configure_metrics, record_cache, timed
+from core.orchestration.workflow_engine import WorkflowEngine
+from tools.api_integrations.tool_registry import Tool
+
+class RecordingMetrics(NoOpMetrics):
+    """Backend that keeps every measurement for inspection."""
+    
+    def __init__(self):
+        self.latencies = []
+        self.counters = []
+        self.gauges = []
+    
+    def observe_latency(self, name, seconds, **labels):
+        self.latencies.append((name, seconds, labels))
+    
+    def increment(self, name, amount=1.0, **labels):
+        self.counters.append((name, amount, labels))
+    
+    def set_gauge(self, name, value, **labels):
+        self.gauges.append((name, value, labels))
+    
+    def label_names(self):
+        """Map each metric name to every set of label names it was recorded with."""
+        seen = {}
+        for name, _, labels in self.latencies + self.counters + self.gauges:
+            seen.setdefault(name, set()).add(tuple(sorted(labels)))
+        return seen
+
+@pytest.fixture
+def recorder():
+    previous = metrics.get_metrics()
+    backend = RecordingMetrics()
+    configure_metrics(backend)
+    yield backend
+    configure_metrics(previous)
+
+def test_timed_records_ok(recorder):
+    with timed("op", kind="a") as outcome:
+        assert outcome.status == "ok"
+    (name, seconds, labels), = recorder.latencies
+    assert (name, labels) == ("op", {"kind": "a"})
+    assert seconds >= 0
+    assert recorder.counters == [("op_calls", 1.0, {"status": "ok", "kind": "a"})]
+
+def test_timed_records_error_and_reraises(recorder):
+    with pytest.raises(RuntimeError):
+        with timed("op"):
+            raise RuntimeError("boom")
+    assert recorder.counters == [("op_calls", 1.0, {"status": "error"})]
+    assert len(recorder.latencies) == 1
+
+def test_timed_records_explicit_status(recorder):
+    with timed("op") as outcome:
+        outcome.status = "error"
+    assert recorder.counters == [("op_calls", 1.0, {"status": "error"})]
+
+def test_record_cache_counts_hits_and_misses(recorder):
+    record_cache("subsystems", hit=True)
+    record_cache("subsystems", hit=False)
+    assert recorder.counters == [
+        ("cache_hits", 1.0, {"cache": "subsystems"}),
+        ("cache_misses", 1.0, {"cache": "subsystems"}),
+    ]
+
+def test_hot_paths_use_consistent_labels(recorder):
+    def fail():
+        raise RuntimeError("boom")
+        
+    Tool("ok", "Succeeds", lambda: 1).execute()
+    with pytest.raises(RuntimeError):
+        Tool("fail", "Fails", fail).execute()
+    engine = WorkflowEngine()
+    for workflow_id in ("a", "b"):
+        engine.register_workflow(workflow_id, {"steps": []})
+        engine.execute_workflow(workflow_id)
+        
+    label_names = recorder.label_names()
+    assert label_names["tool_execute"] == {("tool",)}
+    assert label_names["tool_execute_calls"] == {("status", "tool")}
+    assert label_names["workflow_step"] == {()}
+    assert label_names["workflow_step_calls"] == {("status",)}
+    assert all(len(names) == 1 for names in label_names.values())
+
+def test_prometheus_buckets_and_label_check():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    backend = metrics.PrometheusMetrics(registry=prometheus_client.CollectorRegistry())
+    backend.observe_latency("route", 0.00002, method="index")
+    histogram = backend.metrics[("histogram", "route")]
+    assert histogram._upper_bounds[0] == metrics.LATENCY_BUCKETS[0]
+    with pytest.raises(ValueError):
+        backend.observe_latency("route", 0.00002, agent="r")
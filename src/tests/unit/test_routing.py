@@ -0,0 +1,111 @@
+"""
+Unit tests for capability routing in Alfred Prime.
+"""
+
+from agents.alfred_prime.coordinator import AlfredPrime
+from agents.alfred_prime.routing import CapabilityIndex
+from agents.specialized.agent_base import SpecializedAgent
+
+class EchoAgent(SpecializedAgent):
+    """Agent that reports which agent handled the task."""
+    
+    def process(self, task):
+        return {"response": self.agent_id}
+
+def make_coordinator(config=None):
+    coordinator = AlfredPrime(config)
+    coordinator.register_agent("r", EchoAgent("r", capabilities=["research"], keywords=["search", "essay"]))
+    coordinator.register_agent("w", EchoAgent("w", capabilities=["writing"], keywords=["draft", "blog", "essay"]))
+    return coordinator
+
+def keyword_embedding(text):
+    """Two-dimensional embedding: research-ish vs writing-ish text."""
+    text = text.lower()
+    return [float("research" in text or "investigate" in text), float("writing" in text or "compose" in text)]
+
+def test_score_text_weights_rare_tokens_higher():
+    index = CapabilityIndex()
+    index.add_agent("r", ["research"], ["essay"])
+    index.add_agent("w", ["writing"], ["essay"])
+    scores = index.score_text("research essay")
+    assert scores["r"] > scores["w"] > 0
+    assert index.score_text("unrelated words") == {}
+
+def test_match_capabilities_requires_all():
+    index = CapabilityIndex()
+    index.add_agent("r", ["research", "summarization"])
+    index.add_agent("w", ["writing"])
+    assert index.match_capabilities(["Research"]) == ["r"]
+    assert index.match_capabilities(["research", "writing"]) == []
+
+def test_reregister_removes_stale_tokens():
+    index = CapabilityIndex()
+    index.add_agent("r", ["research"])
+    index.add_agent("r", ["writing"])
+    assert "research" not in index.index
+    assert index.score_text("research") == {}
+    assert index.match_capabilities(["writing"]) == ["r"]
+
+def test_tie_is_below_threshold():
+    index = CapabilityIndex()
+    index.add_agent("r", [], ["essay"])
+    index.add_agent("w", [], ["essay"])
+    _, confidence = index.best_match("essay")
+    assert confidence == 0.0
+
+def test_incidental_token_has_low_confidence():
+    index = CapabilityIndex()
+    index.add_agent("r", ["research"])
+    index.add_agent("w", ["writing"])
+    _, confidence = index.best_match("please plan my holiday trip and research hotels")
+    assert confidence < 0.5
+
+def test_route_explicit():
+    routing = make_coordinator().route_task({"agent_ids": ["w", "missing"]})
+    assert routing == {"agent_ids": ["w"], "confidence": 1.0, "method": "explicit"}
+
+def test_route_capability():
+    routing = make_coordinator().route_task({"capabilities": ["research"]})
+    assert routing["method"] == "capability"
+    assert routing["agent_ids"] == ["r"]
+
+def test_route_index():
+    routing = make_coordinator().route_task({"description": "draft a blog"})
+    assert routing["method"] == "index"
+    assert routing["agent_ids"] == ["w"]
+    assert routing["confidence"] >= 0.5
+
+def test_route_embedding():
+    coordinator = make_coordinator({"embedding_function": keyword_embedding})
+    routing = coordinator.route_task({"description": "investigate this topic"})
+    assert routing["method"] == "embedding"
+    assert routing["agent_ids"] == ["r"]
+
+def test_route_tie_falls_back_to_llm():
+    calls = []
+    
+    def llm_router(task, agent_ids):
+        calls.append(task)
+        return ["r"]
+        
+    routing = make_coordinator({"llm_router": llm_router}).route_task({"description": "an essay"})
+    assert routing["method"] == "llm"
+    assert routing["agent_ids"] == ["r"]
+    assert len(calls) == 1
+
+def test_route_empty_llm_answer_uses_best_guess():
+    coordinator = make_coordinator({"llm_router": lambda task, agent_ids: []})
+    routing = coordinator.route_task({"description": "essay about search engines and more"})
+    assert routing["method"] == "index"
+    assert routing["agent_ids"] == ["r"]
+
+def test_route_tie_without_llm_is_unrouted():
+    routing = make_coordinator().route_task({"description": "an essay"})
+    assert routing == {"agent_ids": [], "confidence": 0.0, "method": "none"}
+
+def test_route_none():
+    coordinator = make_coordinator()
+    assert coordinator.route_task({"description": "hello there"}) == {
+        "agent_ids": [], "confidence": 0.0, "method": "none"
+    }
+    assert coordinator.orchestrate({"description": "hello there"})["status"] == "unrouted"
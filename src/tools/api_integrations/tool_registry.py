@@ -10,6 +10,8 @@ import logging
 from enum import Enum
 import inspect
 
+from core.monitoring.metrics import timed
+
 logger = logging.getLogger(__name__)
 
 class ToolCategory(Enum):
@@ -85,8 +87,9 @@ class Tool:
             Tool execution results
         """
         try:
-            logger.info(f"Executing tool '{self.name}'")
-            return self.function(**kwargs)
+            logger.debug(f"Executing tool '{self.name}'")
+            with timed("tool_execute", tool=self.name):
+                return self.function(**kwargs)
         except Exception as e:
             logger.error(f"Error executing tool '{self.name}': {e}")
             raise
@@ -6,8 +6,9 @@ the Batman & Alfred Multi-Agent Framework.
 """
 
 import os
+import sys
+import asyncio
 import logging
-import gradio as gr
 
 logger = logging.getLogger(__name__)
 
@@ -22,28 +23,82 @@ class BatmanAlfredUI:
         Initialize the Gradio UI.
         
         Args:
-            config: Configuration dictionary for the UI
+            config: Configuration dictionary for the UI. ``coordinator`` is the
+                AlfredPrime instance to stream responses from;
+                ``concurrency_limit`` and ``max_queue_size`` configure the
+                request queue.
         """
         self.config = config or {}
         self.title = self.config.get("title", "Batman & Alfred Multi-Agent Framework")
-        self.theme = self.config.get("theme", gr.themes.Soft())
+        self.theme = self.config.get("theme")
+        self.coordinator = self.config.get("coordinator")
+        self.concurrency_limit = self.config.get("concurrency_limit", int(os.getenv("GRADIO_CONCURRENCY_LIMIT", 4)))
+        self.max_queue_size = self.config.get("max_queue_size", int(os.getenv("GRADIO_MAX_QUEUE_SIZE", 64)))
         self.app = None
+        # Handlers currently streaming; requests waiting in Gradio's queue are not counted
+        self.in_flight = 0
         logger.info("Gradio UI initialized")
     
-    def _process_message(self, message, history):
+    def _response_chunks(self, message):
         """
-        Process a user message and generate a response.
+        Get an iterator over the response chunks for a message.
         
         Args:
             message: User message
-            history: Conversation history
             
         Returns:
-            Agent response
+            Iterator of response text chunks
+        """
+        if self.coordinator is not None:
+            return self.coordinator.orchestrate_stream({"message": message})
+        placeholder = "I'm Alfred, your AI assistant. This is a placeholder response."
+        return iter(word + " " for word in placeholder.split())
+    
+    async def _process_message(self, message, history):
         """
-        # This will be connected to the Alfred Prime coordinator
+        Process a user message and stream the response into the chat.
+        
+        The coordinator's chunk iterator is synchronous, so each chunk is pulled
+        in a worker thread to keep the event loop free for other sessions. If
+        the event is cancelled (e.g. by the Clear button) the iterator is
+        closed so the coordinator stops generating.
+        
+        Args:
+            message: User message
+            history: Conversation history
+            
+        Yields:
+            Cleared textbox value and updated conversation history
+        """
+        # Imported here so this module still loads when run directly as a script
+        from core.monitoring.metrics import get_metrics
+        
         logger.info(f"Processing message: {message}")
-        return "I'm Alfred, your AI assistant. This is a placeholder response."
+        history = (history or []) + [[message, ""]]
+        yield "", history
+        
+        loop = asyncio.get_running_loop()
+        chunks = self._response_chunks(message)
+        sentinel = object()
+        self.in_flight += 1
+        get_metrics().set_gauge("chat_in_flight", self.in_flight)
+        try:
+            while True:
+                chunk = await loop.run_in_executor(None, next, chunks, sentinel)
+                if chunk is sentinel:
+                    break
+                history[-1][1] += chunk
+                yield "", history
+        finally:
+            self.in_flight -= 1
+            get_metrics().set_gauge("chat_in_flight", self.in_flight)
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except ValueError:
+                    # A worker thread is still inside next(); it finishes on its own
+                    logger.debug("Response stream still running while closing")
     
     def build_interface(self):
         """
@@ -52,7 +107,11 @@ class BatmanAlfredUI:
         Returns:
             Gradio interface
         """
-        with gr.Blocks(title=self.title, theme=self.theme) as app:
+        # Imported here so creating the UI object doesn't pay gradio's import cost
+        import gradio as gr
+        
+        theme = self.theme or gr.themes.Soft()
+        with gr.Blocks(title=self.title, theme=theme) as app:
             gr.Markdown(f"# {self.title}")
             gr.Markdown("Your AI assistant powered by a multi-agent framework")
             
@@ -61,13 +120,14 @@ class BatmanAlfredUI:
                 msg = gr.Textbox(placeholder="Type your message here...", show_label=False)
                 clear = gr.Button("Clear")
                 
-                msg.submit(
+                submit_event = msg.submit(
                     self._process_message,
                     [msg, chatbot],
                     [msg, chatbot]
                 )
-                clear.click(lambda: None, None, chatbot, queue=False)
-            
+                # Clearing also cancels this session's in-flight response
+                clear.click(lambda: None, None, chatbot, queue=False, cancels=[submit_event])
+                
             with gr.Tab("Voice"):
                 audio_input = gr.Audio(source="microphone", type="filepath")
                 audio_output = gr.Audio(label="Response")
@@ -77,7 +137,7 @@ class BatmanAlfredUI:
                     inputs=audio_input,
                     outputs=audio_output
                 )
-            
+                
             with gr.Tab("Settings"):
                 gr.Markdown("## Settings")
                 model = gr.Dropdown(
@@ -92,7 +152,11 @@ class BatmanAlfredUI:
                     step=0.1,
                     label="Temperature"
                 )
-        
+                
+        app.queue(
+            default_concurrency_limit=self.concurrency_limit,
+            max_size=self.max_queue_size
+        )
         self.app = app
         return app
     
@@ -109,7 +173,7 @@ class BatmanAlfredUI:
         """
         if self.app is None:
             self.build_interface()
-        
+            
         server_port = server_port or int(os.getenv("GRADIO_PORT", 7860))
         logger.info(f"Launching Gradio interface on port {server_port}")
         self.app.launch(share=share, server_port=server_port)
@@ -129,6 +193,9 @@ def create_ui(config=None):
     return ui
 
 if __name__ == "__main__":
+    # Make the src/ packages importable when this file is run directly
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    
     # Configure logging
     logging.basicConfig(level=logging.INFO)
     